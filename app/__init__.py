@@ -3,16 +3,27 @@ Flask application factory.
 """
 
 from flask import Flask
-from flask_cors import CORS
-from flask_migrate import Migrate
 from app.config import get_config
+from app.json_util import ORJSONProvider
 from app.models import db
+from app.swagger import init_swagger
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, RotatingFileHandler
+import atexit
 import os
+import threading
 
 
-migrate = Migrate()
+_migrate = None
+
+
+def get_migrate():
+    """Return the shared Flask-Migrate instance, importing it on first use."""
+    global _migrate
+    if _migrate is None:
+        from flask_migrate import Migrate
+        _migrate = Migrate()
+    return _migrate
 
 
 def create_app(config_name=None):
@@ -23,9 +34,14 @@ def create_app(config_name=None):
     config = get_config(config_name)
     app.config.from_object(config)
     
+    # Serialize JSON responses with orjson
+    app.json = ORJSONProvider(app)
+    
     # Initialize extensions
+    from flask_cors import CORS
+    
     db.init_app(app)
-    migrate.init_app(app, db)
+    get_migrate().init_app(app, db)
     CORS(app)
     
     # Setup logging
@@ -34,32 +50,30 @@ def create_app(config_name=None):
     # Register blueprints
     register_blueprints(app)
     
-    # Initialize Swagger BEFORE error handlers
-    from flasgger import Swagger
-    
-    swagger = Swagger(app, template={
-        "swagger": "2.0",
-        "info": {
-            "title": "Flow Manager API",
-            "description": "Sequential task execution engine",
-            "version": "1.0.0"
-        },
-        "host": f"localhost:{os.environ.get('FLASK_PORT', 5001)}",
-        "basePath": "/",
-        "schemes": ["http"]
-    })
-    
-    # Create database tables
-    with app.app_context():
-        db.create_all()
-    
-    # Debug: Print routes
-    print("\n" + "="*70)
-    print("ALL REGISTERED ROUTES:")
-    print("="*70)
-    for rule in app.url_map.iter_rules():
-        print(f"{rule.rule:50s} -> {rule.endpoint}")
-    print("="*70 + "\n")
+    # Register error handlers
+    register_error_handlers(app)
+    
+    # Register lazy API docs (spec is built on first request)
+    init_swagger(app)
+    
+    # Create database tables (production relies on `flask db upgrade`)
+    if app.config.get('AUTO_CREATE_TABLES', app.debug or app.testing):
+        with app.app_context():
+            db.create_all()
+            # Don't hand the pooled connection to forked (--preload) workers
+            db.engine.dispose()
+    
+    # Debug: Print routes (opt-in via FLASK_DEBUG_PRINT_ROUTES)
+    if app.debug and os.environ.get('FLASK_DEBUG_PRINT_ROUTES'):
+        print("\n" + "="*70)
+        print("ALL REGISTERED ROUTES:")
+        print("="*70)
+        for rule in app.url_map.iter_rules():
+            print(f"{rule.rule:50s} -> {rule.endpoint}")
+        print("="*70 + "\n")
+    
+    # Populate lazy caches so preloaded workers share them copy-on-write
+    warm_up(app)
     
     app.logger.info('Flow Manager application started')
     
@@ -81,11 +95,73 @@ def setup_logging(app):
             app.config['LOG_FORMAT']
         ))
         file_handler.setLevel(getattr(logging, app.config['LOG_LEVEL']))
-        app.logger.addHandler(file_handler)
+        
+        # Buffer records in memory; errors and a full buffer flush immediately
+        buffered_handler = MemoryHandler(
+            capacity=app.config['LOG_BUFFER_CAPACITY'],
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        )
+        buffered_handler.setLevel(getattr(logging, app.config['LOG_LEVEL']))
+        app.logger.addHandler(buffered_handler)
+        
+        atexit.register(buffered_handler.flush)
+        start_log_flusher(buffered_handler, app.config['LOG_FLUSH_INTERVAL'])
     
     app.logger.setLevel(getattr(logging, app.config['LOG_LEVEL']))
 
 
+def warm_up(app):
+    """
+    Build caches that would otherwise be created on the first request.
+    
+    With `gunicorn --preload` this runs once in the master process and
+    forked workers inherit the result instead of each rebuilding it.
+    """
+    # Compile and sort the URL rules
+    app.url_map.update()
+
+
+def start_log_flusher(handler, interval):
+    """
+    Flush a buffered log handler periodically in this process and its forks.
+    
+    Threads don't survive fork, so with `gunicorn --preload` the flusher
+    started in the master would never run in the workers. Each forked
+    child drops the records it inherited (the parent still writes them)
+    and starts its own flusher.
+    
+    Args:
+        handler: Handler to flush
+        interval: Seconds between flushes
+    """
+    def restart_in_child():
+        handler.buffer.clear()
+        schedule_log_flush(handler, interval)
+    
+    schedule_log_flush(handler, interval)
+    if hasattr(os, 'register_at_fork'):
+        os.register_at_fork(after_in_child=restart_in_child)
+
+
+def schedule_log_flush(handler, interval):
+    """
+    Periodically flush a buffered log handler so quiet periods still reach disk.
+    
+    Args:
+        handler: Handler to flush
+        interval: Seconds between flushes
+    """
+    def flush_and_reschedule():
+        handler.flush()
+        schedule_log_flush(handler, interval)
+    
+    timer = threading.Timer(interval, flush_and_reschedule)
+    timer.daemon = True
+    timer.start()
+
+
 def register_blueprints(app):
     """Register Flask blueprints."""
     from app.api.flows import flows_bp
@@ -95,3 +171,30 @@ def register_blueprints(app):
     app.register_blueprint(flows_bp, url_prefix='/api/flows')
     app.register_blueprint(executions_bp, url_prefix='/api/executions')
     app.register_blueprint(tasks_bp, url_prefix='/api/tasks')
+
+
+def register_error_handlers(app):
+    """Register error handlers."""
+    from flask import jsonify
+    
+    @app.errorhandler(404)
+    def not_found(error):
+        return jsonify({
+            'error': 'Not Found',
+            'message': 'The requested resource was not found'
+        }), 404
+    
+    @app.errorhandler(500)
+    def internal_error(error):
+        db.session.rollback()
+        return jsonify({
+            'error': 'Internal Server Error',
+            'message': 'An internal error occurred'
+        }), 500
+    
+    @app.errorhandler(400)
+    def bad_request(error):
+        return jsonify({
+            'error': 'Bad Request',
+            'message': str(error)
+        }), 400
@@ -4,14 +4,21 @@ API endpoints for flow execution management.
 
 from flask import Blueprint, request, jsonify
 from marshmallow import ValidationError
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import selectinload
 from app.models import db
-from app.models.execution import FlowExecution
-from app.models.schemas import flow_execution_response_schema
+from app.models.execution import FlowExecution, ExecutionStatus
+from datetime import datetime
+import base64
+import binascii
 import logging
 
 executions_bp = Blueprint('executions', __name__)
 logger = logging.getLogger('api.executions')
 
+# Lookup for the status query parameter
+STATUS_BY_VALUE = {status.value: status for status in ExecutionStatus}
+
 
 @executions_bp.route('/<int:execution_id>', methods=['GET'])
 def get_execution(execution_id):
@@ -73,7 +80,12 @@ def get_execution(execution_id):
     try:
         include_tasks = request.args.get('include_tasks', 'false').lower() == 'true'
         
-        execution = FlowExecution.query.filter_by(id=execution_id).first()
+        options = []
+        if include_tasks:
+            # Load all task executions in one extra query instead of lazily
+            options.append(selectinload(FlowExecution.task_executions))
+        
+        execution = db.session.get(FlowExecution, execution_id, options=options)
         
         if not execution:
             return jsonify({
@@ -82,13 +94,11 @@ def get_execution(execution_id):
             }), 404
         
         return jsonify({
-            'data': flow_execution_response_schema.dump(
-                execution.to_dict(include_tasks=include_tasks)
-            )
+            'data': execution.to_dict(include_tasks=include_tasks)
         }), 200
         
     except Exception as e:
-        logger.error(f"Error getting execution {execution_id}: {str(e)}", exc_info=True)
+        logger.error("Error getting execution %s: %s", execution_id, e, exc_info=True)
         return jsonify({
             'error': 'Internal Server Error',
             'message': str(e)
@@ -140,7 +150,11 @@ def get_execution_logs(execution_id):
         description: Execution not found
     """
     try:
-        execution = FlowExecution.query.filter_by(id=execution_id).first()
+        execution = db.session.get(
+            FlowExecution,
+            execution_id,
+            options=[selectinload(FlowExecution.task_executions)]
+        )
         
         if not execution:
             return jsonify({
@@ -149,13 +163,11 @@ def get_execution_logs(execution_id):
             }), 404
         
         return jsonify({
-            'data': flow_execution_response_schema.dump(
-                execution.to_dict(include_tasks=True)
-            )
+            'data': execution.to_dict(include_tasks=True)
         }), 200
         
     except Exception as e:
-        logger.error(f"Error getting execution logs {execution_id}: {str(e)}", exc_info=True)
+        logger.error("Error getting execution logs %s: %s", execution_id, e, exc_info=True)
         return jsonify({
             'error': 'Internal Server Error',
             'message': str(e)
@@ -194,6 +206,16 @@ def list_executions():
         type: integer
         default: 20
         description: Items per page (max 100)
+      - name: with_count
+        in: query
+        type: boolean
+        default: true
+        description: Include total and pages in the pagination (runs a COUNT query)
+      - name: cursor
+        in: query
+        type: string
+        required: false
+        description: Opaque next_cursor from a previous response; replaces page-based paging
     responses:
       200:
         description: List of executions
@@ -211,6 +233,10 @@ def list_executions():
                     type: string
                   status:
                     type: string
+                  error_message:
+                    type: string
+                  error_task:
+                    type: string
                   total_tasks_executed:
                     type: integer
                   started_at:
@@ -228,58 +254,148 @@ def list_executions():
                   type: integer
                 pages:
                   type: integer
+                next_cursor:
+                  type: string
+                  description: Cursor for the next page, null on the last page
       400:
-        description: Invalid status parameter
+        description: Invalid status or cursor parameter
     """
     try:
-        flow_id = request.args.get('flow_id')
-        status = request.args.get('status')
-        page = request.args.get('page', 1, type=int)
-        per_page = min(request.args.get('per_page', 20, type=int), 100)
+        args = request.args
+        flow_id = args.get('flow_id')
+        status = args.get('status')
+        page = args.get('page', 1, type=int)
+        per_page = max(1, min(args.get('per_page', 20, type=int), 100))
+        with_count = args.get('with_count', 'true').lower() == 'true'
+        cursor = args.get('cursor')
         
-        query = FlowExecution.query
+        query = db.session.query(
+            FlowExecution.id,
+            FlowExecution.flow_id,
+            FlowExecution.status,
+            FlowExecution.error_message,
+            FlowExecution.error_task,
+            FlowExecution.total_tasks_executed,
+            FlowExecution.started_at,
+            FlowExecution.completed_at
+        )
         
         if flow_id:
             query = query.filter_by(flow_id=flow_id)
         
         if status:
-            from app.models.execution import ExecutionStatus
-            try:
-                status_enum = ExecutionStatus(status)
-                query = query.filter_by(status=status_enum)
-            except ValueError:
+            status_enum = STATUS_BY_VALUE.get(status)
+            if status_enum is None:
                 return jsonify({
                     'error': 'Bad Request',
                     'message': f"Invalid status: {status}"
                 }), 400
+            query = query.filter_by(status=status_enum)
         
-        # Order by most recent first
-        query = query.order_by(FlowExecution.started_at.desc())
+        # Order by most recent first, id breaks ties between equal timestamps
+        query = query.order_by(FlowExecution.started_at.desc(), FlowExecution.id.desc())
         
-        pagination = query.paginate(
-            page=page,
-            per_page=per_page,
-            error_out=False
-        )
+        if cursor:
+            # Keyset pagination: seek past the last row of the previous page
+            # instead of making the database skip OFFSET rows
+            try:
+                cursor_started_at, cursor_id = decode_cursor(cursor)
+            except ValueError:
+                return jsonify({
+                    'error': 'Bad Request',
+                    'message': f"Invalid cursor: {cursor}"
+                }), 400
+            query = query.filter(or_(
+                FlowExecution.started_at < cursor_started_at,
+                and_(
+                    FlowExecution.started_at == cursor_started_at,
+                    FlowExecution.id < cursor_id
+                )
+            ))
+            items = query.limit(per_page).all()
+            page, total, pages = None, None, None
+        elif with_count:
+            pagination = query.paginate(
+                page=page,
+                per_page=per_page,
+                error_out=False
+            )
+            items, total, pages = pagination.items, pagination.total, pagination.pages
+        else:
+            # Skip the extra COUNT(*) query over the filtered table
+            items = query.limit(per_page).offset(max(page - 1, 0) * per_page).all()
+            total, pages = None, None
         
+        # Build summaries straight from the projected rows
         executions = [
-            flow_execution_response_schema.dump(execution.to_dict())
-            for execution in pagination.items
+            {
+                'id': row.id,
+                'flow_id': row.flow_id,
+                'status': row.status.value,
+                'error_message': row.error_message,
+                'error_task': row.error_task,
+                'total_tasks_executed': row.total_tasks_executed,
+                'started_at': row.started_at,
+                'completed_at': row.completed_at,
+            }
+            for row in items
         ]
         
+        next_cursor = None
+        if items and len(items) == per_page:
+            next_cursor = encode_cursor(items[-1].started_at, items[-1].id)
+        
         return jsonify({
             'data': executions,
             'pagination': {
                 'page': page,
                 'per_page': per_page,
-                'total': pagination.total,
-                'pages': pagination.pages
+                'total': total,
+                'pages': pages,
+                'next_cursor': next_cursor
             }
         }), 200
         
     except Exception as e:
-        logger.error(f"Error listing executions: {str(e)}", exc_info=True)
+        logger.error("Error listing executions: %s", e, exc_info=True)
         return jsonify({
             'error': 'Internal Server Error',
             'message': str(e)
-        }), 500
\ No newline at end of file
+        }), 500
+
+
+def encode_cursor(started_at, execution_id):
+    """
+    Encode a keyset pagination cursor.
+    
+    Args:
+        started_at: Start time of the last execution on the page
+        execution_id: ID of the last execution on the page
+    
+    Returns:
+        URL-safe cursor string
+    """
+    raw = f"{started_at.isoformat()}|{execution_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """
+    Decode a keyset pagination cursor.
+    
+    Args:
+        cursor: Cursor string produced by encode_cursor
+    
+    Returns:
+        Tuple of (started_at: datetime, execution_id: int)
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError(f"Malformed cursor: {cursor}") from e
+    
+    started_at, _, execution_id = raw.partition('|')
+    return datetime.fromisoformat(started_at), int(execution_id)
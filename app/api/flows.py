@@ -3,14 +3,13 @@ API endpoints for flow management.
 """
 
 from flask import Blueprint, request, jsonify
-from flasgger import swag_from
 from marshmallow import ValidationError
+from sqlalchemy import literal_column
 from app.models import db
 from app.models.flow import Flow
 from app.models.schemas import (
     flow_create_request_schema,
-    flow_update_request_schema,
-    flow_response_schema
+    flow_update_request_schema
 )
 from app.core.flow_engine import FlowEngine
 import logging
@@ -18,6 +17,9 @@ import logging
 flows_bp = Blueprint('flows', __name__)
 logger = logging.getLogger('api.flows')
 
+# FlowEngine holds no per-request state, so one instance serves all requests
+flow_engine = FlowEngine()
+
 
 @flows_bp.route('', methods=['POST'])
 def create_flow():
@@ -92,11 +94,11 @@ def create_flow():
         description: Flow already exists
     """
     try:
-        data = flow_create_request_schema.load(request.json)
+        data = flow_create_request_schema.load(request.get_json(silent=True) or {})
         flow_data = data['flow']
         
-        existing_flow = Flow.query.filter_by(id=flow_data['id']).first()
-        if existing_flow:
+        flow_exists = db.session.query(Flow.id).filter_by(id=flow_data['id']).scalar() is not None
+        if flow_exists:
             return jsonify({
                 'error': 'Conflict',
                 'message': f"Flow with id '{flow_data['id']}' already exists"
@@ -104,7 +106,6 @@ def create_flow():
         
         flow = Flow.create_from_json(flow_data)
         
-        flow_engine = FlowEngine()
         is_valid, errors = flow_engine.validate_flow_executable(flow)
         
         if not is_valid:
@@ -117,11 +118,11 @@ def create_flow():
         db.session.add(flow)
         db.session.commit()
         
-        logger.info(f"Created flow: {flow.id}")
+        logger.info("Created flow: %s", flow.id)
         
         return jsonify({
             'message': 'Flow created successfully',
-            'data': flow_response_schema.dump(flow.to_dict())
+            'data': flow.to_dict()
         }), 201
         
     except ValidationError as e:
@@ -131,7 +132,7 @@ def create_flow():
             'details': e.messages
         }), 400
     except Exception as e:
-        logger.error(f"Error creating flow: {str(e)}", exc_info=True)
+        logger.error("Error creating flow: %s", e, exc_info=True)
         return jsonify({
             'error': 'Internal Server Error',
             'message': str(e)
@@ -158,6 +159,11 @@ def list_flows():
         type: integer
         default: 20
         description: Items per page (max 100)
+      - name: with_count
+        in: query
+        type: boolean
+        default: true
+        description: Include total and pages in the pagination (runs a COUNT query)
       - name: active_only
         in: query
         type: boolean
@@ -186,35 +192,45 @@ def list_flows():
                   type: integer
     """
     try:
-        page = request.args.get('page', 1, type=int)
-        per_page = min(request.args.get('per_page', 20, type=int), 100)
-        active_only = request.args.get('active_only', 'false').lower() == 'true'
+        args = request.args
+        page = args.get('page', 1, type=int)
+        per_page = max(1, min(args.get('per_page', 20, type=int), 100))
+        with_count = args.get('with_count', 'true').lower() == 'true'
+        active_only = args.get('active_only', 'false').lower() == 'true'
         
         query = Flow.query
         
         if active_only:
-            query = query.filter_by(is_active=1)
+            # A literal (not a bound parameter) lets the planner match the
+            # partial ix_flows_active index
+            query = query.filter(Flow.is_active == literal_column('1'))
         
-        pagination = query.paginate(
-            page=page,
-            per_page=per_page,
-            error_out=False
-        )
+        if with_count:
+            pagination = query.paginate(
+                page=page,
+                per_page=per_page,
+                error_out=False
+            )
+            items, total, pages = pagination.items, pagination.total, pagination.pages
+        else:
+            # Skip the extra COUNT(*) query over the filtered table
+            items = query.limit(per_page).offset(max(page - 1, 0) * per_page).all()
+            total, pages = None, None
         
-        flows = [flow.to_dict(include_definition=False) for flow in pagination.items]
+        flows = [flow.to_dict(include_definition=False) for flow in items]
         
         return jsonify({
             'data': flows,
             'pagination': {
                 'page': page,
                 'per_page': per_page,
-                'total': pagination.total,
-                'pages': pagination.pages
+                'total': total,
+                'pages': pages
             }
         }), 200
         
     except Exception as e:
-        logger.error(f"Error listing flows: {str(e)}", exc_info=True)
+        logger.error("Error listing flows: %s", e, exc_info=True)
         return jsonify({
             'error': 'Internal Server Error',
             'message': str(e)
@@ -248,7 +264,7 @@ def get_flow(flow_id):
         description: Flow not found
     """
     try:
-        flow = Flow.query.filter_by(id=flow_id).first()
+        flow = db.session.get(Flow, flow_id)
         
         if not flow:
             return jsonify({
@@ -257,11 +273,11 @@ def get_flow(flow_id):
             }), 404
         
         return jsonify({
-            'data': flow_response_schema.dump(flow.to_dict())
+            'data': flow.to_dict()
         }), 200
         
     except Exception as e:
-        logger.error(f"Error getting flow {flow_id}: {str(e)}", exc_info=True)
+        logger.error("Error getting flow %s: %s", flow_id, e, exc_info=True)
         return jsonify({
             'error': 'Internal Server Error',
             'message': str(e)
@@ -301,7 +317,7 @@ def update_flow(flow_id):
         description: Flow not found
     """
     try:
-        flow = Flow.query.filter_by(id=flow_id).first()
+        flow = db.session.get(Flow, flow_id)
         
         if not flow:
             return jsonify({
@@ -309,7 +325,7 @@ def update_flow(flow_id):
                 'message': f"Flow '{flow_id}' not found"
             }), 404
         
-        data = flow_update_request_schema.load(request.json)
+        data = flow_update_request_schema.load(request.get_json(silent=True) or {})
         
         if 'name' in data:
             flow.name = data['name']
@@ -322,11 +338,11 @@ def update_flow(flow_id):
         
         db.session.commit()
         
-        logger.info(f"Updated flow: {flow.id}")
+        logger.info("Updated flow: %s", flow.id)
         
         return jsonify({
             'message': 'Flow updated successfully',
-            'data': flow_response_schema.dump(flow.to_dict())
+            'data': flow.to_dict()
         }), 200
         
     except ValidationError as e:
@@ -336,7 +352,7 @@ def update_flow(flow_id):
             'details': e.messages
         }), 400
     except Exception as e:
-        logger.error(f"Error updating flow {flow_id}: {str(e)}", exc_info=True)
+        logger.error("Error updating flow %s: %s", flow_id, e, exc_info=True)
         return jsonify({
             'error': 'Internal Server Error',
             'message': str(e)
@@ -365,7 +381,7 @@ def delete_flow(flow_id):
         description: Flow not found
     """
     try:
-        flow = Flow.query.filter_by(id=flow_id).first()
+        flow = db.session.get(Flow, flow_id)
         
         if not flow:
             return jsonify({
@@ -373,17 +389,23 @@ def delete_flow(flow_id):
                 'message': f"Flow '{flow_id}' not found"
             }), 404
         
-        db.session.delete(flow)
+        # The database cascades the delete to the flow's executions and
+        # their task executions (ON DELETE CASCADE), so one statement
+        # removes the whole tree without loading any of it
+        db.session.execute(
+            db.delete(Flow).where(Flow.id == flow_id),
+            execution_options={'synchronize_session': False}
+        )
         db.session.commit()
         
-        logger.info(f"Deleted flow: {flow.id}")
+        logger.info("Deleted flow: %s", flow_id)
         
         return jsonify({
             'message': f"Flow '{flow_id}' deleted successfully"
         }), 200
         
     except Exception as e:
-        logger.error(f"Error deleting flow {flow_id}: {str(e)}", exc_info=True)
+        logger.error("Error deleting flow %s: %s", flow_id, e, exc_info=True)
         return jsonify({
             'error': 'Internal Server Error',
             'message': str(e)
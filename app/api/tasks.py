@@ -2,22 +2,98 @@
 API endpoints for task management and flow execution.
 """
 
-from flask import Blueprint, request, jsonify
+from collections import OrderedDict
+from flask import Blueprint, current_app, request, jsonify
 from marshmallow import ValidationError
-from app.models import db
+from sqlalchemy import select
+from sqlalchemy.orm.attributes import set_committed_value
+from app.models import db, TaskExecution
 from app.models.flow import Flow
-from app.models.schemas import (
-    flow_execution_request_schema,
-    flow_execution_response_schema
-)
+from app.models.schemas import flow_execution_request_schema
 from app.core.task_registry import task_registry
 from app.core.flow_engine import FlowEngine
+from app.core.flow_graph import FlowGraph
+from app.core.execution_queue import enqueue_execution
 import logging
+import orjson
+import threading
 
 tasks_bp = Blueprint('tasks', __name__)
 logger = logging.getLogger('api.tasks')
 
 
+# Encoded flow definitions per (flow_id, updated_at), kept per app in
+# app.extensions so apps with different databases never share entries
+FLOW_DEFINITION_CACHE_SIZE = 256
+_definition_cache_lock = threading.Lock()
+
+
+def _get_flow_definition(flow_id, updated_at):
+    """
+    Load a flow's definition, cached per app and flow revision.
+    
+    The cache holds the definition as orjson bytes and every caller gets
+    its own decoded copy, so a run that modifies its definition can't
+    affect later runs.
+    
+    Args:
+        flow_id: Flow ID
+        updated_at: Flow's last update time, so edits miss the cache
+    
+    Returns:
+        Flow definition dictionary owned by the caller
+    """
+    cache = current_app.extensions.setdefault('flow_definition_cache', OrderedDict())
+    key = (flow_id, updated_at)
+    
+    with _definition_cache_lock:
+        encoded = cache.get(key)
+        if encoded is not None:
+            cache.move_to_end(key)
+    
+    if encoded is not None:
+        return orjson.loads(encoded)
+    
+    definition = db.session.query(Flow.definition).filter_by(id=flow_id).scalar()
+    with _definition_cache_lock:
+        cache[key] = orjson.dumps(definition)
+        while len(cache) > FLOW_DEFINITION_CACHE_SIZE:
+            cache.popitem(last=False)
+    return definition
+
+
+def load_flow(flow_id):
+    """
+    Load a flow for execution without re-reading an unchanged definition.
+    
+    Only the flow's scalar columns are selected; the definition JSON comes
+    from the revision cache. The returned Flow is transient and must not
+    be added to the session.
+    
+    Args:
+        flow_id: Flow ID
+    
+    Returns:
+        Tuple of (Flow, FlowGraph), or (None, None) if not found
+    """
+    row = db.session.query(
+        Flow.name, Flow.start_task, Flow.is_active, Flow.updated_at
+    ).filter_by(id=flow_id).first()
+    
+    if row is None:
+        return None, None
+    
+    definition = _get_flow_definition(flow_id, row.updated_at)
+    flow = Flow(
+        id=flow_id,
+        name=row.name,
+        start_task=row.start_task,
+        definition=definition
+    )
+    flow.is_active = row.is_active
+    return flow, FlowGraph(definition)
+
+
 @tasks_bp.route('', methods=['GET'])
 def list_tasks():
     """
@@ -54,7 +130,7 @@ def list_tasks():
         }), 200
         
     except Exception as e:
-        logger.error(f"Error listing tasks: {str(e)}", exc_info=True)
+        logger.error("Error listing tasks: %s", e, exc_info=True)
         return jsonify({
             'error': 'Internal Server Error',
             'message': str(e)
@@ -119,7 +195,71 @@ def get_task(task_name):
         }), 200
         
     except Exception as e:
-        logger.error(f"Error getting task {task_name}: {str(e)}", exc_info=True)
+        logger.error("Error getting task %s: %s", task_name, e, exc_info=True)
+        return jsonify({
+            'error': 'Internal Server Error',
+            'message': str(e)
+        }), 500
+
+
+@tasks_bp.route('/<task_name>/cache', methods=['DELETE'])
+def clear_task_cache(task_name):
+    """
+    Clear a task's cached results
+    ---
+    tags:
+      - Tasks
+    summary: Invalidate task result cache
+    description: Drop the memoized results of a cacheable task so its next run executes again
+    parameters:
+      - name: task_name
+        in: path
+        type: string
+        required: true
+        description: Task name
+        example: "task2"
+    responses:
+      200:
+        description: Cache cleared
+        schema:
+          type: object
+          properties:
+            message:
+              type: string
+            data:
+              type: object
+              properties:
+                name:
+                  type: string
+                  example: "task2"
+                cleared:
+                  type: integer
+                  example: 3
+      404:
+        description: Task not found
+    """
+    try:
+        task = task_registry.get_task(task_name)
+        
+        if not task:
+            return jsonify({
+                'error': 'Not Found',
+                'message': f"Task '{task_name}' not found"
+            }), 404
+        
+        cleared = task.clear_cache()
+        logger.info("Cleared %d cached results for task %s", cleared, task_name)
+        
+        return jsonify({
+            'message': f"Cache cleared for task '{task_name}'",
+            'data': {
+                'name': task.name,
+                'cleared': cleared
+            }
+        }), 200
+        
+    except Exception as e:
+        logger.error("Error clearing cache for task %s: %s", task_name, e, exc_info=True)
         return jsonify({
             'error': 'Internal Server Error',
             'message': str(e)
@@ -142,6 +282,12 @@ def execute_flow(flow_id):
         required: true
         description: Flow ID to execute
         example: "flow123"
+      - name: async
+        in: query
+        type: boolean
+        required: false
+        default: false
+        description: Queue the execution on the worker pool and return immediately; poll GET /api/executions/{id} for the result
       - in: body
         name: body
         description: Execution parameters
@@ -218,6 +364,8 @@ def execute_flow(flow_id):
                         example: 0.51
                       output_data:
                         type: object
+      202:
+        description: Flow execution queued (async=true); data holds the pending execution
       400:
         description: Flow not active or validation error
         schema:
@@ -252,7 +400,7 @@ def execute_flow(flow_id):
     """
     try:
         # Get the flow
-        flow = Flow.query.filter_by(id=flow_id).first()
+        flow, graph = load_flow(flow_id)
         
         if not flow:
             return jsonify({
@@ -271,17 +419,41 @@ def execute_flow(flow_id):
         data = flow_execution_request_schema.load(request.json or {})
         input_context = data.get('input_context', {})
         
-        # Execute the flow
         flow_engine = FlowEngine()
-        execution = flow_engine.execute_flow(flow, input_context)
         
-        logger.info(f"Flow {flow_id} execution {execution.id} completed with status: {execution.status.value}")
+        # Queue the execution instead of running it on the request thread
+        if request.args.get('async', 'false').lower() == 'true':
+            execution = flow_engine.create_execution(flow, input_context)
+            enqueue_execution(current_app._get_current_object(), flow, execution.id, graph)
+            
+            logger.info("Flow %s execution %s queued", flow_id, execution.id)
+            
+            return jsonify({
+                'message': 'Flow execution queued',
+                'data': execution.to_dict()
+            }), 202
+        
+        # Execute the flow
+        execution = flow_engine.execute_flow(flow, input_context, graph=graph)
+        
+        logger.info(
+            "Flow %s execution %s completed with status: %s",
+            flow_id, execution.id, execution.status.value
+        )
+        
+        # The engine inserts task executions outside the session; load them
+        # with one query and attach them for the response
+        set_committed_value(execution, 'task_executions', db.session.scalars(
+            select(TaskExecution)
+            .filter_by(flow_execution_id=execution.id)
+            .order_by(TaskExecution.started_at)
+        ).all())
         
+        # to_dict already produces the response schema's exact shape, so the
+        # marshmallow dump pass over every task execution is skipped
         return jsonify({
             'message': 'Flow execution completed',
-            'data': flow_execution_response_schema.dump(
-                execution.to_dict(include_tasks=True)
-            )
+            'data': execution.to_dict(include_tasks=True)
         }), 200
         
     except ValidationError as e:
@@ -291,7 +463,7 @@ def execute_flow(flow_id):
             'details': e.messages
         }), 400
     except Exception as e:
-        logger.error(f"Error executing flow {flow_id}: {str(e)}", exc_info=True)
+        logger.error("Error executing flow %s: %s", flow_id, e, exc_info=True)
         db.session.rollback()
         return jsonify({
             'error': 'Internal Server Error',
@@ -22,7 +22,10 @@ class Config:
     
     # JSON settings
     JSON_SORT_KEYS = False
-    JSONIFY_PRETTYPRINT_REGULAR = True
+    JSONIFY_PRETTYPRINT_REGULAR = False  # Compact responses, also in debug mode
+    
+    # API docs settings
+    SWAGGER_CACHE_BUST = False  # Rebuild the API spec on every request
     
     # Request settings
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max request size
@@ -31,10 +34,13 @@ class Config:
     LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
     LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     LOG_FILE = os.environ.get('LOG_FILE', 'flow_manager.log')
+    LOG_BUFFER_CAPACITY = 512  # Records buffered before writing to the log file
+    LOG_FLUSH_INTERVAL = 30  # Seconds between periodic log buffer flushes
     
     # Flow execution settings
     MAX_FLOW_EXECUTION_TIME = int(os.environ.get('MAX_FLOW_EXECUTION_TIME', 3600))  # 1 hour in seconds
     TASK_TIMEOUT = int(os.environ.get('TASK_TIMEOUT', 300))  # 5 minutes in seconds
+    EXECUTION_WORKERS = int(os.environ.get('EXECUTION_WORKERS', 4))  # Threads running async=true executions
     
     # Pagination settings
     DEFAULT_PAGE_SIZE = 20
@@ -48,6 +54,7 @@ class DevelopmentConfig(Config):
     SQLALCHEMY_DATABASE_URI = os.environ.get('DEV_DATABASE_URL') or \
         'sqlite:///flow_manager_dev.db'
     SQLALCHEMY_ECHO = True  # Log all SQL queries in development
+    SWAGGER_CACHE_BUST = True  # Pick up docstring changes without restarting
     
     # More verbose logging in development
     LOG_LEVEL = 'DEBUG'
@@ -86,6 +93,9 @@ class ProductionConfig(Config):
     # Don't echo SQL in production
     SQLALCHEMY_ECHO = False
     
+    # Schema is managed by migrations (flask db upgrade)
+    AUTO_CREATE_TABLES = False
+    
     # Production logging
     LOG_LEVEL = os.environ.get('LOG_LEVEL', 'WARNING')
 
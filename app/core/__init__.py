@@ -3,11 +3,13 @@ Core package - Contains flow execution logic.
 """
 
 from app.core.flow_engine import FlowEngine
+from app.core.flow_graph import FlowGraph
 from app.core.task_registry import TaskRegistry, task_registry
 from app.core.condition_evaluator import ConditionEvaluator
 
 __all__ = [
     'FlowEngine',
+    'FlowGraph',
     'TaskRegistry',
     'task_registry',
     'ConditionEvaluator'
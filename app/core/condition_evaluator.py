@@ -2,10 +2,18 @@
 Condition evaluator for determining flow execution paths.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import logging
 
 
+# (expected outcome, actual status) pairs that count as a match; 'any'
+# matches every status and is checked separately
+_MATCH = {
+    ('success', 'success'): True,
+    ('failure', 'failure'): True,
+}
+
+
 class ConditionEvaluator:
     """
     Evaluates conditions to determine the next task in a flow.
@@ -37,33 +45,35 @@ class ConditionEvaluator:
         actual_status = task_result.get('status', 'failure')
         
         self.logger.debug(
-            f"Evaluating condition: expected={expected_outcome}, actual={actual_status}"
+            "Evaluating condition: expected=%s, actual=%s", expected_outcome, actual_status
         )
         
         # Check if outcome matches
-        if self._outcome_matches(expected_outcome, actual_status):
+        if expected_outcome == 'any' or _MATCH.get((expected_outcome, actual_status), False):
             next_task = condition.get('target_task_success', 'end')
-            self.logger.info(f"Condition matched, proceeding to: {next_task}")
+            self.logger.info("Condition matched, proceeding to: %s", next_task)
             return next_task
         else:
             next_task = condition.get('target_task_failure', 'end')
-            self.logger.info(f"Condition not matched, proceeding to: {next_task}")
+            self.logger.info("Condition not matched, proceeding to: %s", next_task)
             return next_task
     
-    def _outcome_matches(self, expected: str, actual: str) -> bool:
+    @staticmethod
+    def index_conditions(conditions: list) -> Dict[str, List[Dict[str, Any]]]:
         """
-        Check if actual outcome matches expected outcome.
+        Group condition definitions by their source task.
         
         Args:
-            expected: Expected outcome ('success', 'failure', 'any')
-            actual: Actual task status ('success', 'failure')
+            conditions: List of condition definitions
         
         Returns:
-            True if outcomes match, False otherwise
+            Dictionary mapping source task names to their conditions, in
+            definition order
         """
-        if expected == 'any':
-            return True
-        return expected == actual
+        conditions_by_source = {}
+        for condition in conditions or []:
+            conditions_by_source.setdefault(condition.get('source_task'), []).append(condition)
+        return conditions_by_source
     
     def find_condition_for_task(
         self,
@@ -84,7 +94,7 @@ class ConditionEvaluator:
             if condition.get('source_task') == task_name:
                 return condition
         
-        self.logger.warning(f"No condition found for task: {task_name}")
+        self.logger.warning("No condition found for task: %s", task_name)
         return None
     
     def validate_condition(self, condition: Dict[str, Any]) -> tuple:
@@ -0,0 +1,78 @@
+"""
+Background execution queue for running flows off the request thread.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from app.core.flow_engine import FlowEngine
+from app.models import db, FlowExecution
+import logging
+import threading
+
+
+logger = logging.getLogger('ExecutionQueue')
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor(app) -> ThreadPoolExecutor:
+    """
+    Get the shared worker pool, creating it on first use.
+
+    Args:
+        app: Flask application instance
+
+    Returns:
+        ThreadPoolExecutor running queued flow executions
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=app.config.get('EXECUTION_WORKERS', 4),
+                    thread_name_prefix='flow-execution'
+                )
+    return _executor
+
+
+def enqueue_execution(app, flow, execution_id: int, graph=None) -> None:
+    """
+    Queue a pending flow execution to run on the worker pool.
+
+    Args:
+        app: Flask application instance
+        flow: Flow to execute; must not be bound to the request's session
+        execution_id: ID of the pending FlowExecution created for the run
+        graph: Optional prebuilt FlowGraph for the flow
+    """
+    get_executor(app).submit(_run_execution, app, flow, execution_id, graph)
+
+
+def _run_execution(app, flow, execution_id: int, graph=None) -> None:
+    """
+    Run a queued flow execution inside its own application context.
+
+    Args:
+        app: Flask application instance
+        flow: Flow to execute
+        execution_id: ID of the pending FlowExecution
+        graph: Optional prebuilt FlowGraph for the flow
+    """
+    with app.app_context():
+        try:
+            flow_execution = db.session.get(FlowExecution, execution_id)
+            if flow_execution is None:
+                logger.warning("Queued execution %s no longer exists", execution_id)
+                return
+
+            FlowEngine().execute_flow(
+                flow,
+                flow_execution.input_context,
+                flow_execution=flow_execution,
+                graph=graph
+            )
+
+        except Exception as e:
+            logger.error("Queued execution %s failed: %s", execution_id, e, exc_info=True)
+            db.session.rollback()
@@ -2,9 +2,10 @@
 Flow engine - Core execution logic for running flows.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from app.core.task_registry import task_registry
 from app.core.condition_evaluator import ConditionEvaluator
+from app.core.flow_graph import FlowGraph
 from app.models import db, FlowExecution, TaskExecution, ExecutionStatus
 from app.models.flow import Flow
 import logging
@@ -24,39 +25,79 @@ class FlowEngine:
         self.condition_evaluator = ConditionEvaluator()
         self.logger = logging.getLogger('FlowEngine')
     
-    def execute_flow(
+    def create_execution(
         self,
         flow: Flow,
         input_context: Optional[Dict[str, Any]] = None
     ) -> FlowExecution:
         """
-        Execute a complete flow.
+        Create and commit a pending execution record for a flow.
         
         Args:
             flow: Flow model instance
             input_context: Initial context data for the flow
         
         Returns:
-            FlowExecution instance with execution results
+            Pending FlowExecution instance
         """
-        # Create flow execution record
         flow_execution = FlowExecution(
             flow_id=flow.id,
             input_context=input_context or {}
         )
         db.session.add(flow_execution)
         db.session.commit()
+        return flow_execution
+    
+    def execute_flow(
+        self,
+        flow: Flow,
+        input_context: Optional[Dict[str, Any]] = None,
+        flow_execution: Optional[FlowExecution] = None,
+        graph: Optional[FlowGraph] = None
+    ) -> FlowExecution:
+        """
+        Execute a complete flow.
+        
+        Args:
+            flow: Flow model instance
+            input_context: Initial context data for the flow
+            flow_execution: Pending execution from create_execution() to
+                run, or None to create a new one
+            graph: Prebuilt FlowGraph for the flow's definition, or None to
+                index it here
+        
+        Returns:
+            FlowExecution instance with execution results
+        """
+        # Create flow execution record and commit it as running before any
+        # task starts, so no transaction is held open while a task runs;
+        # after that the transaction is committed once per executed task
+        if flow_execution is None:
+            flow_execution = FlowExecution(
+                flow_id=flow.id,
+                input_context=input_context or {}
+            )
+            db.session.add(flow_execution)
+        flow_execution.mark_running()
+        db.session.commit()
+        
+        self.logger.info("Starting flow execution %s for flow %s", flow_execution.id, flow.id)
         
-        self.logger.info(f"Starting flow execution {flow_execution.id} for flow {flow.id}")
+        # Task executions recorded since the last commit, and the running
+        # count that is written to the execution once it finishes
+        pending_task_executions = []
+        tasks_executed = 0
         
         try:
-            # Mark as running
-            flow_execution.mark_running()
-            db.session.commit()
-            
             # Initialize execution context
             context = input_context.copy() if input_context else {}
             
+            # Index the definition once instead of scanning it every step
+            if graph is None:
+                graph = FlowGraph(flow.definition)
+            tasks_by_name = graph.tasks_by_name
+            conditions_by_source = graph.conditions_by_source
+            
             # Start execution loop
             current_task_name = flow.start_task
             sequence_number = 1
@@ -64,19 +105,19 @@ class FlowEngine:
             while current_task_name != 'end':
                 # Execute current task
                 task_result = self._execute_task(
-                    flow_execution,
-                    flow,
+                    flow_execution.id,
+                    tasks_by_name.get(current_task_name),
                     current_task_name,
                     context,
-                    sequence_number
+                    sequence_number,
+                    pending_task_executions
                 )
                 
                 # Update execution counter
-                flow_execution.total_tasks_executed = sequence_number
-                db.session.commit()
+                tasks_executed = sequence_number
                 
                 # Check if task failed and no condition exists
-                conditions = flow.get_conditions_for_task(current_task_name)
+                conditions = conditions_by_source.get(current_task_name, [])
                 
                 if not conditions:
                     # No conditions defined, end flow
@@ -87,7 +128,6 @@ class FlowEngine:
                         )
                     else:
                         flow_execution.mark_completed(context)
-                    db.session.commit()
                     break
                 
                 # Evaluate conditions to get next task
@@ -98,8 +138,8 @@ class FlowEngine:
                 )
                 
                 self.logger.info(
-                    f"Task {current_task_name} completed with status {task_result.get('status')}, "
-                    f"next task: {next_task_name}"
+                    "Task %s completed with status %s, next task: %s",
+                    current_task_name, task_result.get('status'), next_task_name
                 )
                 
                 # Check if we should end
@@ -111,49 +151,58 @@ class FlowEngine:
                         )
                     else:
                         flow_execution.mark_completed(context)
-                    db.session.commit()
                     break
                 
+                # Persist this task's progress before moving on
+                self._insert_task_executions(pending_task_executions)
+                db.session.commit()
+                
                 # Move to next task
                 current_task_name = next_task_name
                 sequence_number += 1
             
-            self.logger.info(f"Flow execution {flow_execution.id} completed successfully")
+            flow_execution.total_tasks_executed = tasks_executed
+            self._insert_task_executions(pending_task_executions)
+            db.session.commit()
+            
+            self.logger.info("Flow execution %s completed successfully", flow_execution.id)
             
         except Exception as e:
             self.logger.error(
-                f"Flow execution {flow_execution.id} failed with error: {str(e)}",
+                "Flow execution %s failed with error: %s", flow_execution.id, e,
                 exc_info=True
             )
             flow_execution.mark_failed(str(e))
+            flow_execution.total_tasks_executed = tasks_executed
+            self._insert_task_executions(pending_task_executions)
             db.session.commit()
         
         return flow_execution
     
     def _execute_task(
         self,
-        flow_execution: FlowExecution,
-        flow: Flow,
+        flow_execution_id: int,
+        task_def: Optional[Dict[str, Any]],
         task_name: str,
         context: Dict[str, Any],
-        sequence_number: int
+        sequence_number: int,
+        pending_task_executions: List[TaskExecution]
     ) -> Dict[str, Any]:
         """
         Execute a single task and record its execution.
         
         Args:
-            flow_execution: Parent flow execution
-            flow: Flow definition
+            flow_execution_id: ID of the parent flow execution
+            task_def: Task definition from the flow, or None if missing
             task_name: Name of task to execute
             context: Current execution context
             sequence_number: Order of this task in the flow
+            pending_task_executions: List the task's execution record is
+                appended to, for execute_flow to insert
         
         Returns:
             Task execution result dictionary
         """
-        # Get task definition from flow
-        task_def = flow.get_task_by_name(task_name)
-        
         if not task_def:
             error_msg = f"Task '{task_name}' not found in flow definition"
             self.logger.error(error_msg)
@@ -173,24 +222,21 @@ class FlowEngine:
                 'error': error_msg
             }
         
-        # Create task execution record
+        # Create task execution record; execute_flow inserts it together
+        # with the flow execution's progress
         task_execution = TaskExecution(
-            flow_execution_id=flow_execution.id,
+            flow_execution_id=flow_execution_id,
             task_name=task_name,
             sequence_number=sequence_number,
             task_description=task_def.get('description'),
             input_data=context.copy()
         )
-        db.session.add(task_execution)
-        db.session.commit()
+        task_execution.mark_running()
+        pending_task_executions.append(task_execution)
         
         try:
-            # Mark as running
-            task_execution.mark_running()
-            db.session.commit()
-            
             # Execute the task
-            self.logger.info(f"Executing task: {task_name}")
+            self.logger.info("Executing task: %s", task_name)
             result = task.run(context)
             
             # Update context with task result
@@ -204,8 +250,6 @@ class FlowEngine:
                     result.get('error', 'Task failed without error message')
                 )
             
-            db.session.commit()
-            
             return result
             
         except Exception as e:
@@ -213,18 +257,31 @@ class FlowEngine:
             error_trace = traceback.format_exc()
             
             self.logger.error(
-                f"Task {task_name} execution failed: {error_msg}",
+                "Task %s execution failed: %s", task_name, error_msg,
                 exc_info=True
             )
             
             task_execution.mark_failure(error_msg, error_trace)
-            db.session.commit()
             
             return {
                 'status': 'failure',
                 'error': error_msg
             }
     
+    def _insert_task_executions(self, task_executions: List[TaskExecution]) -> None:
+        """
+        Insert recorded task executions with a single bulk INSERT.
+        
+        The records never enter the session, which skips the unit of work
+        and keeps them out of the identity map. The list is emptied.
+        
+        Args:
+            task_executions: Transient TaskExecution instances to insert
+        """
+        records = [task_execution.to_mapping() for task_execution in task_executions]
+        task_executions.clear()
+        TaskExecution.bulk_create_mappings(db.session, records)
+    
     def validate_flow_executable(self, flow: Flow) -> tuple:
         """
         Validate that a flow can be executed.
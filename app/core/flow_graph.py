@@ -0,0 +1,37 @@
+"""
+Flow graph - indexed view of a flow definition used during execution.
+"""
+
+from typing import Dict, Any, Optional
+from app.core.condition_evaluator import ConditionEvaluator
+
+
+class FlowGraph:
+    """
+    Task and condition indexes built from a flow definition.
+    
+    Building the graph once per execution lets the engine look tasks and
+    conditions up directly instead of scanning the definition each step.
+    """
+    
+    def __init__(self, definition: Optional[Dict[str, Any]]):
+        """
+        Index a flow definition.
+        
+        Args:
+            definition: Flow definition containing tasks and conditions
+        """
+        self.definition = definition or {}
+        tasks = self.definition.get('tasks') or []
+        
+        # Task names in definition order, including any duplicates
+        self.task_names = [task.get('name') for task in tasks if task.get('name')]
+        
+        # Task definitions keyed by name; the first of any duplicates wins
+        self.tasks_by_name = {}
+        for task in tasks:
+            self.tasks_by_name.setdefault(task.get('name'), task)
+        
+        self.conditions_by_source = ConditionEvaluator.index_conditions(
+            self.definition.get('conditions')
+        )
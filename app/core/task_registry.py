@@ -9,26 +9,22 @@ import logging
 
 class TaskRegistry:
     """
-    Singleton registry for managing task instances.
+    Registry for managing task instances.
     
-    Allows dynamic registration and retrieval of tasks.
+    Allows dynamic registration and retrieval of tasks. The application
+    shares the module-level ``task_registry`` instance.
     """
     
-    _instance = None
-    _tasks: Dict[str, BaseTask] = {}
-    
-    def __new__(cls):
-        """Implement singleton pattern."""
-        if cls._instance is None:
-            cls._instance = super(TaskRegistry, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
-    
-    def __init__(self):
-        """Initialize registry if not already initialized."""
-        if not self._initialized:
-            self.logger = logging.getLogger('TaskRegistry')
-            self._initialized = True
+    def __init__(self, register_defaults: bool = True):
+        """
+        Initialize the registry.
+        
+        Args:
+            register_defaults: Whether to register the built-in tasks
+        """
+        self.logger = logging.getLogger('TaskRegistry')
+        self._tasks: Dict[str, BaseTask] = {}
+        if register_defaults:
             self._register_default_tasks()
     
     def _register_default_tasks(self):
@@ -39,7 +35,7 @@ class TaskRegistry:
         self.register_task(ProcessDataTask())
         self.register_task(StoreDataTask())
         
-        self.logger.info(f"Registered {len(self._tasks)} default tasks")
+        self.logger.info("Registered %d default tasks", len(self._tasks))
     
     def register_task(self, task: BaseTask) -> None:
         """
@@ -55,10 +51,10 @@ class TaskRegistry:
             raise ValueError(f"Task must be an instance of BaseTask, got {type(task)}")
         
         if task.name in self._tasks:
-            self.logger.warning(f"Task '{task.name}' already registered, overwriting")
+            self.logger.warning("Task '%s' already registered, overwriting", task.name)
         
         self._tasks[task.name] = task
-        self.logger.info(f"Registered task: {task.name}")
+        self.logger.info("Registered task: %s", task.name)
     
     def get_task(self, task_name: str) -> Optional[BaseTask]:
         """
@@ -72,7 +68,7 @@ class TaskRegistry:
         """
         task = self._tasks.get(task_name)
         if task is None:
-            self.logger.warning(f"Task '{task_name}' not found in registry")
+            self.logger.warning("Task '%s' not found in registry", task_name)
         return task
     
     def list_tasks(self) -> Dict[str, str]:
@@ -111,7 +107,7 @@ class TaskRegistry:
         """
         if task_name in self._tasks:
             del self._tasks[task_name]
-            self.logger.info(f"Unregistered task: {task_name}")
+            self.logger.info("Unregistered task: %s", task_name)
             return True
         return False
     
@@ -0,0 +1,57 @@
+"""
+JSON provider backed by orjson.
+
+Registered as ``app.json`` so ``jsonify`` and ``request.get_json`` use
+orjson instead of the stdlib ``json`` module.
+"""
+
+from flask.json.provider import DefaultJSONProvider
+import orjson
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that serializes with orjson.
+
+    Types orjson can't handle natively (e.g. Decimal) fall back to
+    Flask's default conversion.
+    """
+
+    def __init__(self, app):
+        """
+        Initialize the provider.
+
+        Args:
+            app: Flask application instance
+        """
+        super().__init__(app)
+        self.sort_keys = app.config.get('JSON_SORT_KEYS', self.sort_keys)
+        pretty = app.config.get('JSONIFY_PRETTYPRINT_REGULAR')
+        if pretty is not None:
+            # Flask no longer reads this setting itself; map it onto compact
+            self.compact = not pretty
+
+    def _option(self, indent=False):
+        """Build the orjson option flags for a dump."""
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs):
+        """Serialize data as a JSON string."""
+        option = self._option(indent=bool(kwargs.get('indent')))
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize data from a JSON string or bytes."""
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Serialize the arguments as JSON and wrap them in a response."""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(obj, default=self.default, option=self._option(indent=indent))
+        return self._app.response_class(body + b'\n', mimetype=self.mimetype)
@@ -4,9 +4,44 @@ Initializes SQLAlchemy and exports all models.
 """
 
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import JSON, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.dialects.postgresql import JSONB
+import orjson
+import sqlite3
+
+
+def _json_serializer(value):
+    """Encode a JSON column value with orjson."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Initialize SQLAlchemy instance. Objects are not expired on commit: the
+# engine commits once per task and every endpoint serializes what it just
+# wrote, so reloading each committed row would only add SELECTs. JSON
+# columns are encoded and decoded with orjson; on psycopg2 SQLAlchemy hands
+# the deserializer to the driver, so JSONB is decoded with it there too
+db = SQLAlchemy(
+    session_options={'expire_on_commit': False},
+    engine_options={
+        'json_serializer': _json_serializer,
+        'json_deserializer': orjson.loads,
+    }
+)
+
+# JSON document columns: binary JSONB on PostgreSQL so reads skip re-parsing
+# the stored text, plain JSON on every other database
+JSONDocument = JSON().with_variant(JSONB(), 'postgresql')
+
+
+@event.listens_for(Engine, 'connect')
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    """Make SQLite enforce foreign keys, including ON DELETE CASCADE."""
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA foreign_keys=ON')
+        cursor.close()
 
-# Initialize SQLAlchemy instance
-db = SQLAlchemy()
 
 # Import models after db initialization to avoid circular imports
 from app.models.flow import Flow
@@ -3,14 +3,22 @@ Execution models - represents flow and task execution records.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, ForeignKey, Index, Enum as SQLEnum, insert
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql.expression import FunctionElement
 import enum
-from app.models import db
+from app.models import db, JSONDocument
 
 
-class ExecutionStatus(enum.Enum):
-    """Enum for execution status values."""
+class ExecutionStatus(str, enum.Enum):
+    """
+    Enum for execution status values.
+    
+    Members are also strings, so they compare equal to their values and
+    serialize as plain JSON strings.
+    """
     PENDING = 'pending'
     RUNNING = 'running'
     SUCCESS = 'success'
@@ -18,6 +26,41 @@ class ExecutionStatus(enum.Enum):
     COMPLETED = 'completed'
 
 
+class elapsed_seconds(FunctionElement):
+    """SQL expression for the seconds between two timestamp columns."""
+    
+    type = Float()
+    inherit_cache = True
+    name = 'elapsed_seconds'
+
+
+@compiles(elapsed_seconds)
+def _compile_elapsed_seconds(element, compiler, **kw):
+    """Compile elapsed_seconds(start, end) for PostgreSQL (EXTRACT EPOCH)."""
+    start, end = list(element.clauses)
+    return f"EXTRACT(EPOCH FROM ({compiler.process(end, **kw)} - {compiler.process(start, **kw)}))"
+
+
+@compiles(elapsed_seconds, 'mysql')
+def _compile_elapsed_seconds_mysql(element, compiler, **kw):
+    """Compile elapsed_seconds(start, end) for MySQL, which lacks EXTRACT(EPOCH ...)."""
+    start, end = list(element.clauses)
+    return (
+        f"(TIMESTAMPDIFF(MICROSECOND, {compiler.process(start, **kw)}, "
+        f"{compiler.process(end, **kw)}) / 1e6)"
+    )
+
+
+@compiles(elapsed_seconds, 'sqlite')
+def _compile_elapsed_seconds_sqlite(element, compiler, **kw):
+    """Compile elapsed_seconds(start, end) for SQLite, which lacks EXTRACT."""
+    start, end = list(element.clauses)
+    return (
+        f"((julianday({compiler.process(end, **kw)}) - "
+        f"julianday({compiler.process(start, **kw)})) * 86400.0)"
+    )
+
+
 class FlowExecution(db.Model):
     """
     FlowExecution model representing a single execution instance of a flow.
@@ -31,21 +74,20 @@ class FlowExecution(db.Model):
     id = Column(Integer, primary_key=True, autoincrement=True)
     
     # Foreign key to Flow
-    flow_id = Column(String(100), ForeignKey('flows.id', ondelete='CASCADE'), nullable=False, index=True)
+    flow_id = Column(String(100), ForeignKey('flows.id', ondelete='CASCADE'), nullable=False)
     
     # Execution status
     status = Column(
         SQLEnum(ExecutionStatus),
         default=ExecutionStatus.PENDING,
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # Input context for the flow execution
-    input_context = Column(JSON, nullable=True)
+    input_context = Column(JSONDocument, nullable=True)
     
     # Final output after flow completion
-    output_data = Column(JSON, nullable=True)
+    output_data = Column(JSONDocument, nullable=True)
     
     # Error information if execution failed
     error_message = Column(Text, nullable=True)
@@ -55,16 +97,29 @@ class FlowExecution(db.Model):
     total_tasks_executed = Column(Integer, default=0, nullable=False)
     
     # Timestamps
-    started_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    started_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     completed_at = Column(DateTime, nullable=True)
     
+    # Listing indexes: executions newest first, unfiltered or filtered by
+    # flow or status, without a sort step. The leading columns also serve
+    # plain flow_id and status lookups
+    __table_args__ = (
+        Index('ix_flow_executions_started_at_id', 'started_at', 'id'),
+        Index('ix_flow_executions_flow_id_started_at_id', 'flow_id', 'started_at', 'id'),
+        Index('ix_flow_executions_status_started_at_id', 'status', 'started_at', 'id'),
+    )
+    
     # Relationships
     flow = relationship('Flow', back_populates='executions')
     task_executions = relationship(
         'TaskExecution',
         back_populates='flow_execution',
         cascade='all, delete-orphan',
-        order_by='TaskExecution.started_at'
+        passive_deletes=True,
+        order_by='TaskExecution.started_at',
+        # Callers must eager-load this (selectinload) so serializing many
+        # executions can't silently fall into one query per execution
+        lazy='raise_on_sql'
     )
     
     def __init__(self, flow_id, input_context=None):
@@ -91,7 +146,8 @@ class FlowExecution(db.Model):
             include_tasks: Whether to include task execution details
         
         Returns:
-            Dictionary representation of the FlowExecution
+            Dictionary representation of the FlowExecution. Timestamps are left as
+            datetime objects for the JSON provider to format as ISO 8601
         """
         data = {
             'id': self.id,
@@ -102,8 +158,8 @@ class FlowExecution(db.Model):
             'error_message': self.error_message,
             'error_task': self.error_task,
             'total_tasks_executed': self.total_tasks_executed,
-            'started_at': self.started_at.isoformat() if self.started_at else None,
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+            'started_at': self.started_at,
+            'completed_at': self.completed_at,
         }
         
         if include_tasks:
@@ -141,18 +197,32 @@ class FlowExecution(db.Model):
         self.error_message = error_message
         self.error_task = error_task
     
-    def get_duration_seconds(self):
+    @hybrid_property
+    def duration_seconds(self):
         """
-        Calculate the duration of the execution in seconds.
+        Duration of the execution in seconds, or None if not completed.
         
-        Returns:
-            Duration in seconds or None if not completed
+        Also usable in queries, e.g. to sort by duration in the database.
         """
         if not self.completed_at:
             return None
         
         duration = self.completed_at - self.started_at
         return duration.total_seconds()
+    
+    @duration_seconds.expression
+    def duration_seconds(cls):
+        """SQL expression for the duration; NULL while not completed."""
+        return elapsed_seconds(cls.started_at, cls.completed_at)
+    
+    def get_duration_seconds(self):
+        """
+        Calculate the duration of the execution in seconds.
+        
+        Returns:
+            Duration in seconds or None if not completed
+        """
+        return self.duration_seconds
 
 
 class TaskExecution(db.Model):
@@ -171,8 +241,7 @@ class TaskExecution(db.Model):
     flow_execution_id = Column(
         Integer,
         ForeignKey('flow_executions.id', ondelete='CASCADE'),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # Task information
@@ -191,8 +260,8 @@ class TaskExecution(db.Model):
     )
     
     # Task input and output
-    input_data = Column(JSON, nullable=True)
-    output_data = Column(JSON, nullable=True)
+    input_data = Column(JSONDocument, nullable=True)
+    output_data = Column(JSONDocument, nullable=True)
     
     # Error information
     error_message = Column(Text, nullable=True)
@@ -202,6 +271,11 @@ class TaskExecution(db.Model):
     started_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     completed_at = Column(DateTime, nullable=True)
     
+    # Loads a flow execution's tasks in order (see the relationship order_by)
+    __table_args__ = (
+        Index('ix_task_executions_flow_execution_id_started_at', 'flow_execution_id', 'started_at'),
+    )
+    
     # Relationships
     flow_execution = relationship('FlowExecution', back_populates='task_executions')
     
@@ -232,7 +306,8 @@ class TaskExecution(db.Model):
         Convert TaskExecution to dictionary representation.
         
         Returns:
-            Dictionary representation of the TaskExecution
+            Dictionary representation of the TaskExecution. Timestamps are left as
+            datetime objects for the JSON provider to format as ISO 8601
         """
         return {
             'id': self.id,
@@ -244,11 +319,39 @@ class TaskExecution(db.Model):
             'input_data': self.input_data,
             'output_data': self.output_data,
             'error_message': self.error_message,
-            'started_at': self.started_at.isoformat() if self.started_at else None,
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
-            'duration_seconds': self.get_duration_seconds()
+            'started_at': self.started_at,
+            'completed_at': self.completed_at,
+            'duration_seconds': self.duration_seconds
+        }
+    
+    def to_mapping(self):
+        """
+        Get the column values of this TaskExecution for a bulk insert.
+        
+        Returns:
+            Dictionary of column values, without the generated id
+        """
+        return {
+            column.key: getattr(self, column.key)
+            for column in self.__table__.columns
+            if column.key != 'id'
         }
     
+    @classmethod
+    def bulk_create_mappings(cls, session, records):
+        """
+        Insert many task executions with a single batched INSERT.
+        
+        The rows bypass the unit of work and are not added to the session's
+        identity map.
+        
+        Args:
+            session: SQLAlchemy session to execute on
+            records: List of column-value dictionaries, e.g. from to_mapping()
+        """
+        if records:
+            session.execute(insert(cls), records)
+    
     def mark_running(self):
         """Mark the task execution as running."""
         self.status = ExecutionStatus.RUNNING
@@ -278,15 +381,29 @@ class TaskExecution(db.Model):
         self.error_message = error_message
         self.error_traceback = error_traceback
     
-    def get_duration_seconds(self):
+    @hybrid_property
+    def duration_seconds(self):
         """
-        Calculate the duration of the task execution in seconds.
+        Duration of the task execution in seconds, or None if not completed.
         
-        Returns:
-            Duration in seconds or None if not completed
+        Also usable in queries, e.g. to sort by duration in the database.
         """
         if not self.completed_at:
             return None
         
         duration = self.completed_at - self.started_at
         return duration.total_seconds()
+    
+    @duration_seconds.expression
+    def duration_seconds(cls):
+        """SQL expression for the duration; NULL while not completed."""
+        return elapsed_seconds(cls.started_at, cls.completed_at)
+    
+    def get_duration_seconds(self):
+        """
+        Calculate the duration of the task execution in seconds.
+        
+        Returns:
+            Duration in seconds or None if not completed
+        """
+        return self.duration_seconds
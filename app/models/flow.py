@@ -3,9 +3,11 @@ Flow model - represents flow definitions in the system.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON
-from sqlalchemy.orm import relationship
-from app.models import db
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index, event, text
+from sqlalchemy.orm import relationship, validates
+from collections import Counter
+from functools import cached_property
+from app.models import db, JSONDocument
 
 
 class Flow(db.Model):
@@ -27,7 +29,7 @@ class Flow(db.Model):
     
     # Flow definition stored as JSON
     # Contains: tasks list, conditions list, and other configuration
-    definition = Column(JSON, nullable=False)
+    definition = Column(JSONDocument, nullable=False)
     
     # Status and versioning
     is_active = Column(Integer, default=1, nullable=False)  # 1 for active, 0 for inactive
@@ -37,8 +39,24 @@ class Flow(db.Model):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
+    # Partial index over active flows only, for the active_only listing.
+    # Queries must compare is_active to the literal 1 for it to match
+    __table_args__ = (
+        Index(
+            'ix_flows_active',
+            'id',
+            postgresql_where=text('is_active = 1'),
+            sqlite_where=text('is_active = 1')
+        ),
+    )
+    
     # Relationships
-    executions = relationship('FlowExecution', back_populates='flow', cascade='all, delete-orphan')
+    executions = relationship(
+        'FlowExecution',
+        back_populates='flow',
+        cascade='all, delete-orphan',
+        passive_deletes=True
+    )
     
     def __init__(self, id, name, start_task, definition, description=None):
         """
@@ -69,7 +87,8 @@ class Flow(db.Model):
             include_definition: Whether to include the full definition JSON
         
         Returns:
-            Dictionary representation of the Flow
+            Dictionary representation of the Flow. Timestamps are left as
+            datetime objects for the JSON provider to format as ISO 8601
         """
         data = {
             'id': self.id,
@@ -78,8 +97,8 @@ class Flow(db.Model):
             'start_task': self.start_task,
             'is_active': bool(self.is_active),
             'version': self.version,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
         }
         
         if include_definition:
@@ -87,6 +106,19 @@ class Flow(db.Model):
         
         return data
     
+    @validates('definition')
+    def _reset_graph(self, key, definition):
+        """Drop the cached flow graph when the definition changes."""
+        self.__dict__.pop('_graph', None)
+        return definition
+    
+    @cached_property
+    def _graph(self):
+        """Task and condition indexes for the definition, built on first use."""
+        # Imported here: app.core imports the models package
+        from app.core.flow_graph import FlowGraph
+        return FlowGraph(self.definition)
+    
     def get_task_by_name(self, task_name):
         """
         Get a task definition by name from the flow definition.
@@ -97,14 +129,7 @@ class Flow(db.Model):
         Returns:
             Task dictionary or None if not found
         """
-        if not self.definition or 'tasks' not in self.definition:
-            return None
-        
-        for task in self.definition['tasks']:
-            if task.get('name') == task_name:
-                return task
-        
-        return None
+        return self._graph.tasks_by_name.get(task_name)
     
     def get_conditions_for_task(self, task_name):
         """
@@ -116,13 +141,7 @@ class Flow(db.Model):
         Returns:
             List of condition dictionaries
         """
-        if not self.definition or 'conditions' not in self.definition:
-            return []
-        
-        return [
-            condition for condition in self.definition['conditions']
-            if condition.get('source_task') == task_name
-        ]
+        return list(self._graph.conditions_by_source.get(task_name, []))
     
     def get_all_task_names(self):
         """
@@ -131,10 +150,7 @@ class Flow(db.Model):
         Returns:
             List of task names
         """
-        if not self.definition or 'tasks' not in self.definition:
-            return []
-        
-        return [task.get('name') for task in self.definition['tasks'] if task.get('name')]
+        return list(self._graph.task_names)
     
     def validate_flow_structure(self):
         """
@@ -155,15 +171,17 @@ class Flow(db.Model):
             errors.append("Flow must contain at least one task")
             return False, errors
         
-        task_names = self.get_all_task_names()
+        task_names = self._graph.task_names
+        known_tasks = self._graph.tasks_by_name.keys()
         
         # Check if start_task exists in tasks
-        if self.start_task not in task_names:
+        if self.start_task not in known_tasks:
             errors.append(f"Start task '{self.start_task}' not found in tasks list")
         
         # Check for duplicate task names
-        if len(task_names) != len(set(task_names)):
-            errors.append("Duplicate task names found in flow definition")
+        duplicates = [name for name, count in Counter(task_names).items() if count > 1]
+        if duplicates:
+            errors.append(f"Duplicate task names found in flow definition: {', '.join(duplicates)}")
         
         # Validate conditions if present
         if 'conditions' in self.definition:
@@ -173,14 +191,14 @@ class Flow(db.Model):
                 target_failure = condition.get('target_task_failure')
                 
                 # Check if source task exists
-                if source and source not in task_names:
+                if source and source not in known_tasks:
                     errors.append(f"Condition {idx}: source_task '{source}' not found in tasks")
                 
                 # Check if target tasks exist (unless it's 'end')
-                if target_success and target_success != 'end' and target_success not in task_names:
+                if target_success and target_success != 'end' and target_success not in known_tasks:
                     errors.append(f"Condition {idx}: target_task_success '{target_success}' not found in tasks")
                 
-                if target_failure and target_failure != 'end' and target_failure not in task_names:
+                if target_failure and target_failure != 'end' and target_failure not in known_tasks:
                     errors.append(f"Condition {idx}: target_task_failure '{target_failure}' not found in tasks")
         
         return len(errors) == 0, errors
@@ -211,3 +229,10 @@ class Flow(db.Model):
             definition=flow_json,
             description=flow_json.get('description')
         )
+
+
+@event.listens_for(Flow, 'refresh')
+@event.listens_for(Flow, 'expire')
+def _drop_cached_graph(flow, *args):
+    """Drop the cached flow graph when the ORM reloads or expires the flow."""
+    flow.__dict__.pop('_graph', None)
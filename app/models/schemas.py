@@ -4,14 +4,24 @@ Schemas for request/response validation and serialization.
 Uses Marshmallow for robust validation and serialization.
 """
 
+from collections import Counter
 from marshmallow import Schema, fields, validate, validates, validates_schema, ValidationError, post_load
 
 
+# Shared validators; marshmallow validators are stateless, so one instance
+# can be reused by every field that applies the same rule
+_LEN_1_100 = validate.Length(min=1, max=100)
+_LEN_1_255 = validate.Length(min=1, max=255)
+_LEN_MAX_500 = validate.Length(max=500)
+_LEN_MAX_1000 = validate.Length(max=1000)
+_OUTCOME = validate.OneOf(['success', 'failure', 'any'])
+
+
 class TaskSchema(Schema):
     """Schema for validating task definitions within a flow."""
     
-    name = fields.Str(required=True, validate=validate.Length(min=1, max=100))
-    description = fields.Str(required=False, allow_none=True, validate=validate.Length(max=500))
+    name = fields.Str(required=True, validate=_LEN_1_100)
+    description = fields.Str(required=False, allow_none=True, validate=_LEN_MAX_500)
     config = fields.Dict(required=False, allow_none=True)
     
     class Meta:
@@ -22,15 +32,12 @@ class TaskSchema(Schema):
 class ConditionSchema(Schema):
     """Schema for validating condition definitions within a flow."""
     
-    name = fields.Str(required=True, validate=validate.Length(min=1, max=100))
-    description = fields.Str(required=False, allow_none=True, validate=validate.Length(max=500))
-    source_task = fields.Str(required=True, validate=validate.Length(min=1, max=100))
-    outcome = fields.Str(
-        required=True,
-        validate=validate.OneOf(['success', 'failure', 'any'])
-    )
-    target_task_success = fields.Str(required=True, validate=validate.Length(min=1, max=100))
-    target_task_failure = fields.Str(required=True, validate=validate.Length(min=1, max=100))
+    name = fields.Str(required=True, validate=_LEN_1_100)
+    description = fields.Str(required=False, allow_none=True, validate=_LEN_MAX_500)
+    source_task = fields.Str(required=True, validate=_LEN_1_100)
+    outcome = fields.Str(required=True, validate=_OUTCOME)
+    target_task_success = fields.Str(required=True, validate=_LEN_1_100)
+    target_task_failure = fields.Str(required=True, validate=_LEN_1_100)
     
     class Meta:
         """Meta options."""
@@ -40,25 +47,30 @@ class ConditionSchema(Schema):
 class FlowDefinitionSchema(Schema):
     """Schema for validating complete flow definitions."""
     
-    id = fields.Str(required=True, validate=validate.Length(min=1, max=100))
-    name = fields.Str(required=True, validate=validate.Length(min=1, max=255))
-    description = fields.Str(required=False, allow_none=True, validate=validate.Length(max=1000))
-    start_task = fields.Str(required=True, validate=validate.Length(min=1, max=100))
+    id = fields.Str(required=True, validate=_LEN_1_100)
+    name = fields.Str(required=True, validate=_LEN_1_255)
+    description = fields.Str(required=False, allow_none=True, validate=_LEN_MAX_1000)
+    start_task = fields.Str(required=True, validate=_LEN_1_100)
     tasks = fields.List(fields.Nested(TaskSchema), required=True, validate=validate.Length(min=1))
     conditions = fields.List(fields.Nested(ConditionSchema), required=False, allow_none=True)
     
     @validates('tasks')
     def validate_tasks(self, tasks):
         """Validate that task names are unique."""
-        task_names = [task['name'] for task in tasks]
-        if len(task_names) != len(set(task_names)):
-            raise ValidationError('Task names must be unique within a flow')
+        duplicates = [
+            name for name, count in Counter(task['name'] for task in tasks).items()
+            if count > 1
+        ]
+        if duplicates:
+            raise ValidationError(
+                f"Task names must be unique within a flow: {', '.join(duplicates)}"
+            )
     
     @validates_schema
     def validate_flow_structure(self, data, **kwargs):
         """Validate the overall flow structure."""
         tasks = data.get('tasks', [])
-        task_names = [task['name'] for task in tasks]
+        task_names = {task['name'] for task in tasks}
         start_task = data.get('start_task')
         conditions = data.get('conditions', [])
         
@@ -109,9 +121,9 @@ class FlowCreateRequestSchema(Schema):
 class FlowUpdateRequestSchema(Schema):
     """Schema for updating an existing flow."""
     
-    name = fields.Str(required=False, validate=validate.Length(min=1, max=255))
-    description = fields.Str(required=False, allow_none=True, validate=validate.Length(max=1000))
-    start_task = fields.Str(required=False, validate=validate.Length(min=1, max=100))
+    name = fields.Str(required=False, validate=_LEN_1_255)
+    description = fields.Str(required=False, allow_none=True, validate=_LEN_MAX_1000)
+    start_task = fields.Str(required=False, validate=_LEN_1_100)
     tasks = fields.List(fields.Nested(TaskSchema), required=False)
     conditions = fields.List(fields.Nested(ConditionSchema), required=False)
     is_active = fields.Bool(required=False)
@@ -133,10 +145,6 @@ class FlowResponseSchema(Schema):
     created_at = fields.Str()
     updated_at = fields.Str()
     definition = fields.Dict(required=False)
-    
-    class Meta:
-        """Meta options."""
-        ordered = True
 
 
 class FlowExecutionRequestSchema(Schema):
@@ -170,10 +178,6 @@ class TaskExecutionResponseSchema(Schema):
     started_at = fields.Str()
     completed_at = fields.Str(allow_none=True)
     duration_seconds = fields.Float(allow_none=True)
-    
-    class Meta:
-        """Meta options."""
-        ordered = True
 
 
 class FlowExecutionResponseSchema(Schema):
@@ -189,14 +193,11 @@ class FlowExecutionResponseSchema(Schema):
     total_tasks_executed = fields.Int()
     started_at = fields.Str()
     completed_at = fields.Str(allow_none=True)
-    task_executions = fields.List(
-        fields.Nested(TaskExecutionResponseSchema),
+    task_executions = fields.Nested(
+        TaskExecutionResponseSchema,
+        many=True,
         required=False
     )
-    
-    class Meta:
-        """Meta options."""
-        ordered = True
 
 
 class PaginationSchema(Schema):
@@ -204,10 +205,6 @@ class PaginationSchema(Schema):
     
     page = fields.Int(required=False, load_default=1, validate=validate.Range(min=1))
     per_page = fields.Int(required=False, load_default=20, validate=validate.Range(min=1, max=100))
-    
-    class Meta:
-        """Meta options."""
-        ordered = True
 
 
 class ErrorResponseSchema(Schema):
@@ -217,10 +214,6 @@ class ErrorResponseSchema(Schema):
     message = fields.Str(required=True)
     details = fields.Dict(required=False, allow_none=True)
     timestamp = fields.Str(required=False)
-    
-    class Meta:
-        """Meta options."""
-        ordered = True
 
 
 class SuccessResponseSchema(Schema):
@@ -228,10 +221,6 @@ class SuccessResponseSchema(Schema):
     
     message = fields.Str(required=True)
     data = fields.Dict(required=False, allow_none=True)
-    
-    class Meta:
-        """Meta options."""
-        ordered = True
 
 
 # Create schema instances for reuse
@@ -0,0 +1,204 @@
+"""
+Lazy Swagger/OpenAPI documentation.
+
+The API spec is generated on the first request to ``/apispec_1.json`` instead
+of at application startup, so workers and tests that never touch the docs
+don't pay for importing flasgger or introspecting every route. The
+generated spec is also cached under the instance folder, keyed by a hash
+of the route map, so later processes can skip generation entirely.
+"""
+
+from flask import jsonify, send_from_directory
+from importlib.util import find_spec
+import glob
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+
+
+SPEC_ROUTE = '/apispec_1.json'
+DOCS_ROUTE = '/apidocs/'
+STATIC_ROUTE = '/flasgger_static'
+
+SWAGGER_CONFIG = {
+    "headers": [],
+    "specs": [
+        {
+            "endpoint": 'apispec',
+            "route": SPEC_ROUTE,
+            "rule_filter": lambda rule: True,
+            "model_filter": lambda tag: True,
+        }
+    ]
+}
+
+SWAGGER_TEMPLATE = {
+    "swagger": "2.0",
+    "info": {
+        "title": "Flow Manager API",
+        "description": "Sequential task execution engine with conditional routing",
+        "contact": {
+            "responsibleOrganization": "Flow Manager",
+            "email": "support@flowmanager.com",
+        },
+        "version": "1.0.0"
+    },
+    "host": f"localhost:{os.environ.get('FLASK_PORT', 5001)}",
+    "basePath": "/",
+    "schemes": ["http"],
+}
+
+DOCS_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+  <title>Flow Manager API</title>
+  <link rel="stylesheet" href="{static}/swagger-ui.css">
+</head>
+<body>
+  <div id="swagger-ui"></div>
+  <script src="{static}/swagger-ui-bundle.js"></script>
+  <script>SwaggerUIBundle({{url: "{spec}", dom_id: "#swagger-ui"}});</script>
+</body>
+</html>
+"""
+
+_lock = threading.Lock()
+logger = logging.getLogger('swagger')
+
+
+def init_swagger(app):
+    """
+    Register the lazy API spec and docs views.
+
+    Args:
+        app: Flask application instance
+    """
+
+    cache_bust = app.config.get('SWAGGER_CACHE_BUST')
+    spec_file = None
+
+    def apispec():
+        spec = app.extensions.get('swagger_spec')
+        if spec is None:
+            with _lock:
+                spec = app.extensions.get('swagger_spec')
+                if spec is None:
+                    spec = load_spec(app, None if cache_bust else spec_file)
+                    app.extensions['swagger_spec'] = spec
+        return jsonify(spec)
+
+    def docs():
+        return DOCS_PAGE.format(static=STATIC_ROUTE, spec=SPEC_ROUTE)
+
+    def static(filename):
+        # Locate flasgger's bundled Swagger UI assets without importing it
+        package_dir = find_spec('flasgger').submodule_search_locations[0]
+        return send_from_directory(os.path.join(package_dir, 'ui3', 'static'), filename)
+
+    app.add_url_rule(SPEC_ROUTE, 'apispec', apispec)
+    app.add_url_rule(DOCS_ROUTE, 'apidocs', docs)
+    app.add_url_rule(f'{STATIC_ROUTE}/<path:filename>', 'flasgger_static', static)
+
+    if cache_bust:
+        @app.before_request
+        def bust_swagger_cache():
+            app.extensions.pop('swagger_spec', None)
+    else:
+        spec_file = os.path.join(app.instance_path, f'apispec.{route_map_hash(app)}.json')
+        remove_stale_specs(app.instance_path, keep=spec_file)
+
+
+def route_map_hash(app):
+    """
+    Fingerprint everything the generated spec depends on.
+
+    Covers the URL map, the modification times of the blueprint modules
+    (whose docstrings hold the endpoint docs) and the spec template.
+
+    Args:
+        app: Flask application instance
+
+    Returns:
+        Hex digest identifying the current API surface
+    """
+    h = hashlib.sha256()
+    for rule in sorted(str(r) for r in app.url_map.iter_rules()):
+        h.update(rule.encode())
+    for blueprint in app.blueprints.values():
+        module = sys.modules.get(blueprint.import_name)
+        module_file = getattr(module, '__file__', None)
+        if module_file:
+            h.update(f'{module_file}:{os.path.getmtime(module_file)}'.encode())
+    h.update(json.dumps(SWAGGER_TEMPLATE, sort_keys=True).encode())
+    return h.hexdigest()[:16]
+
+
+def remove_stale_specs(directory, keep):
+    """
+    Delete cached spec files left behind by previous route maps.
+
+    Args:
+        directory: Directory holding the cached spec files
+        keep: Path of the spec file for the current route map
+    """
+    for path in glob.glob(os.path.join(directory, 'apispec.*.json')):
+        if path != keep:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def load_spec(app, spec_file=None):
+    """
+    Load the API spec from the on-disk cache, generating it on a miss.
+
+    Args:
+        app: Flask application instance
+        spec_file: Cache file path, or None to always regenerate
+
+    Returns:
+        Swagger spec as a dictionary
+    """
+    if spec_file and os.path.exists(spec_file):
+        with open(spec_file) as f:
+            return json.load(f)
+
+    spec = build_spec(app)
+
+    if spec_file:
+        try:
+            os.makedirs(os.path.dirname(spec_file), exist_ok=True)
+            tmp_file = f'{spec_file}.{os.getpid()}.tmp'
+            with open(tmp_file, 'w') as f:
+                json.dump(spec, f)
+            os.replace(tmp_file, spec_file)
+        except OSError as e:
+            logger.warning("Could not cache API spec to %s: %s", spec_file, e)
+
+    return spec
+
+
+def build_spec(app):
+    """
+    Generate the API spec dictionary with flasgger.
+
+    The Swagger object is not attached to the app: registering its
+    blueprint is not allowed once the app has started serving requests,
+    and only the spec generation is needed here.
+
+    Args:
+        app: Flask application instance
+
+    Returns:
+        Swagger spec as a dictionary
+    """
+    from flasgger import Swagger
+
+    swagger = Swagger(config=dict(SWAGGER_CONFIG), template=SWAGGER_TEMPLATE)
+    swagger.app = app
+    swagger.load_config(app)
+    return swagger.get_apispecs(endpoint='apispec')
@@ -2,18 +2,53 @@
 Base task class for all tasks in the flow manager.
 """
 
-from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
+import asyncio
+import copy
+import hashlib
+import inspect
 import logging
+import threading
+import time
+import orjson
 
 
-class BaseTask(ABC):
+class BaseTask:
     """
-    Abstract base class for all tasks.
+    Base class for all tasks.
     
-    All tasks must inherit from this class and implement the execute method.
+    All tasks must inherit from this class and implement the execute method;
+    subclasses that don't are rejected when the class is defined.
+    
+    Tasks whose output depends only on their inputs can set ``cacheable``
+    so successful results are reused for identical inputs instead of
+    running ``execute`` again.
     """
     
+    # Context paths that must be present before execute runs, e.g.
+    # (('task1', 'data'),) requires context['task1']['data']
+    required_context_keys: tuple = ()
+    
+    # Result memoization settings
+    cacheable: bool = False
+    cache_input_keys: tuple = ()  # Context keys the result depends on
+    cache_ttl: float = 300  # Seconds a cached result stays valid
+    cache_size: int = 256  # Maximum cached results per task
+    
+    def __init_subclass__(cls, **kwargs):
+        """Require every task class to implement execute."""
+        super().__init_subclass__(**kwargs)
+        if cls.execute is BaseTask.execute:
+            raise TypeError(f"{cls.__name__} must implement execute()")
+        if cls.cacheable and not cls.cache_input_keys and cls.cache_inputs is BaseTask.cache_inputs:
+            # Without inputs every context would hash to the same cache key
+            raise TypeError(
+                f"{cls.__name__} is cacheable but declares no cache_input_keys "
+                "and does not override cache_inputs()"
+            )
+    
     def __init__(self, name: str, description: str = ""):
         """
         Initialize base task.
@@ -25,12 +60,20 @@ class BaseTask(ABC):
         self.name = name
         self.description = description
         self.logger = logging.getLogger(f"task.{name}")
+        self._result_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Resolved once here rather than inspected on every run
+        self._execute_is_async = inspect.iscoroutinefunction(self.execute)
     
-    @abstractmethod
     def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute the task logic.
         
+        May be declared ``async def`` for tasks that use async I/O clients
+        (HTTP, database drivers). ``run`` still blocks the calling thread
+        until the coroutine finishes: it runs it on a fresh event loop, so
+        an async task does not free the thread or run alongside other tasks.
+        
         Args:
             context: Dictionary containing data from previous tasks and input
         
@@ -40,7 +83,7 @@ class BaseTask(ABC):
                 - data: Output data (optional)
                 - error: Error message if status is 'failure' (optional)
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement execute()")
     
     def run(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -52,25 +95,130 @@ class BaseTask(ABC):
         Returns:
             Task execution result
         """
-        self.logger.info(f"Starting task: {self.name}")
+        self.logger.info("Starting task: %s", self.name)
         
         try:
-            result = self.execute(context)
+            missing = self._missing_context(context)
+            if missing is not None:
+                self.logger.error("Missing required key in context: %s", missing)
+                return {
+                    'status': 'failure',
+                    'error': f"Missing required context: {missing}"
+                }
+            
+            cache_key = self._cache_key(context) if self.cacheable else None
+            if cache_key is not None:
+                cached = self._get_cached_result(cache_key)
+                if cached is not None:
+                    self.logger.info("Task %s served from cache", self.name)
+                    return cached
+            
+            if self._execute_is_async:
+                result = self._run_coroutine(self.execute(context))
+            else:
+                result = self.execute(context)
             
             # Ensure result has required fields
             if 'status' not in result:
                 result['status'] = 'success'
             
-            self.logger.info(f"Task {self.name} completed with status: {result['status']}")
+            if cache_key is not None and result['status'] == 'success':
+                self._store_cached_result(cache_key, result)
+            
+            self.logger.info("Task %s completed with status: %s", self.name, result['status'])
             return result
             
         except Exception as e:
-            self.logger.error(f"Task {self.name} failed with error: {str(e)}", exc_info=True)
+            self.logger.error("Task %s failed with error: %s", self.name, e, exc_info=True)
             return {
                 'status': 'failure',
                 'error': str(e)
             }
     
+    @staticmethod
+    def _run_coroutine(coroutine):
+        """
+        Run an async execute() to completion and return its result.
+        
+        Uses a fresh event loop in this thread, or in a helper thread when
+        this thread is already running a loop (e.g. an async view), since
+        asyncio.run() can't be nested.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+    
+    def cache_inputs(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Select the part of the context that determines the task's result.
+        
+        Override when the result depends on something narrower than whole
+        context entries.
+        
+        Args:
+            context: Execution context
+        
+        Returns:
+            Values the cache key is built from
+        """
+        return {key: context.get(key) for key in self.cache_input_keys}
+    
+    def clear_cache(self) -> int:
+        """
+        Drop all cached results for this task.
+        
+        Returns:
+            Number of cached results removed
+        """
+        with self._cache_lock:
+            count = len(self._result_cache)
+            self._result_cache.clear()
+        return count
+    
+    def _missing_context(self, context: Dict[str, Any]):
+        """Return the first required context path that is absent, dotted, or None."""
+        for path in self.required_context_keys:
+            value = context
+            for key in path:
+                if not isinstance(value, dict) or key not in value:
+                    return '.'.join(path)
+                value = value[key]
+        return None
+    
+    def _cache_key(self, context: Dict[str, Any]) -> str:
+        """Hash the task name and its cache inputs into a cache key."""
+        payload = orjson.dumps(
+            {'name': self.name, 'inputs': self.cache_inputs(context)},
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    def _get_cached_result(self, key: str):
+        """Return a copy of an unexpired cached result, or None."""
+        with self._cache_lock:
+            entry = self._result_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at < time.monotonic():
+                del self._result_cache[key]
+                return None
+            self._result_cache.move_to_end(key)
+        # Deep copies keep callers from mutating the cached nested data
+        return copy.deepcopy(result)
+    
+    def _store_cached_result(self, key: str, result: Dict[str, Any]) -> None:
+        """Cache a result, evicting the least recently used if full."""
+        with self._cache_lock:
+            self._result_cache[key] = (time.monotonic() + self.cache_ttl, copy.deepcopy(result))
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self.cache_size:
+                self._result_cache.popitem(last=False)
+    
     def validate_input(self, context: Dict[str, Any], required_keys: list) -> bool:
         """
         Validate that required keys exist in context.
@@ -84,6 +232,6 @@ class BaseTask(ABC):
         """
         for key in required_keys:
             if key not in context:
-                self.logger.error(f"Missing required key in context: {key}")
+                self.logger.error("Missing required key in context: %s", key)
                 return False
         return True
@@ -1,14 +1,21 @@
 """
 Simple test script to verify the application works.
 Run with: python test_basic.py
+Set TEST_VERBOSE=1 to print every response body.
 """
 
+import os
 import requests
-import json
-import time
+import orjson
 
 BASE_URL = "http://localhost:5001"
 
+# Print full response bodies for passing requests too (TEST_VERBOSE=1)
+VERBOSE = os.environ.get('TEST_VERBOSE') == '1'
+
+# Shared session so every request reuses one keep-alive connection
+SESSION = requests.Session()
+
 
 def print_section(title):
     """Print a section header."""
@@ -17,20 +24,26 @@ def print_section(title):
     print("=" * 60)
 
 
+def print_response(response):
+    """Print the status code, plus the full body if verbose or on failure."""
+    print(f"Status Code: {response.status_code}")
+    if VERBOSE or not response.ok:
+        print(f"Response: {orjson.dumps(response.json(), option=orjson.OPT_INDENT_2).decode()}")
+
+
 def test_create_flow():
     """Test creating a flow."""
     print_section("TEST 1: Create Flow")
     
-    with open('sample_flow.json', 'r') as f:
-        flow_data = json.load(f)
+    with open('sample_flow.json', 'rb') as f:
+        flow_data = orjson.loads(f.read())
     
-    response = requests.post(
+    response = SESSION.post(
         f"{BASE_URL}/api/flows",
         json=flow_data
     )
     
-    print(f"Status Code: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
+    print_response(response)
     
     return response.status_code == 201
 
@@ -39,10 +52,9 @@ def test_list_flows():
     """Test listing flows."""
     print_section("TEST 2: List Flows")
     
-    response = requests.get(f"{BASE_URL}/api/flows")
+    response = SESSION.get(f"{BASE_URL}/api/flows")
     
-    print(f"Status Code: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
+    print_response(response)
     
     return response.status_code == 200
 
@@ -51,10 +63,9 @@ def test_get_flow():
     """Test getting a specific flow."""
     print_section("TEST 3: Get Flow Details")
     
-    response = requests.get(f"{BASE_URL}/api/flows/flow123")
+    response = SESSION.get(f"{BASE_URL}/api/flows/flow123")
     
-    print(f"Status Code: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
+    print_response(response)
     
     return response.status_code == 200
 
@@ -63,10 +74,9 @@ def test_list_tasks():
     """Test listing available tasks."""
     print_section("TEST 4: List Available Tasks")
     
-    response = requests.get(f"{BASE_URL}/api/tasks")
+    response = SESSION.get(f"{BASE_URL}/api/tasks")
     
-    print(f"Status Code: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
+    print_response(response)
     
     return response.status_code == 200
 
@@ -75,7 +85,7 @@ def test_execute_flow():
     """Test executing a flow."""
     print_section("TEST 5: Execute Flow")
     
-    response = requests.post(
+    response = SESSION.post(
         f"{BASE_URL}/api/tasks/flows/flow123/execute",
         json={
             "input_context": {
@@ -85,8 +95,7 @@ def test_execute_flow():
         }
     )
     
-    print(f"Status Code: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
+    print_response(response)
     
     if response.status_code == 200:
         execution_id = response.json()['data']['id']
@@ -99,12 +108,11 @@ def test_get_execution(execution_id):
     """Test getting execution details."""
     print_section("TEST 6: Get Execution Details")
     
-    response = requests.get(
+    response = SESSION.get(
         f"{BASE_URL}/api/executions/{execution_id}?include_tasks=true"
     )
     
-    print(f"Status Code: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
+    print_response(response)
     
     return response.status_code == 200
 
@@ -121,24 +129,19 @@ def main():
     try:
         # Test 1: Create flow
         results.append(("Create Flow", test_create_flow()))
-        time.sleep(0.5)
         
         # Test 2: List flows
         results.append(("List Flows", test_list_flows()))
-        time.sleep(0.5)
         
         # Test 3: Get flow
         results.append(("Get Flow", test_get_flow()))
-        time.sleep(0.5)
         
         # Test 4: List tasks
         results.append(("List Tasks", test_list_tasks()))
-        time.sleep(0.5)
         
         # Test 5: Execute flow
         success, execution_id = test_execute_flow()
         results.append(("Execute Flow", success))
-        time.sleep(1)
         
         # Test 6: Get execution (if execution succeeded)
         if execution_id:
@@ -150,6 +153,9 @@ def main():
         print("   python run.py")
         return
     
+    finally:
+        SESSION.close()
+    
     # Print summary
     print_section("TEST SUMMARY")
     